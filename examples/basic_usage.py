@@ -51,14 +51,12 @@ def main():
         
         # Example 3: Manual connection management
         print("3. Manual connection management...")
-        conn = connector.connect()
-        print(f"Connected: {connector.is_connected()}")
-        
         with connector.get_cursor() as cursor:
             cursor.execute("SELECT current_database(), current_user")
             db_info = cursor.fetchone()
             print(f"Current database: {db_info['current_database']}")
             print(f"Current user: {db_info['current_user']}")
+        print(f"Connected: {connector.is_connected()}")
         
         connector.disconnect()
         print(f"Connected: {connector.is_connected()}")
@@ -5,41 +5,53 @@ Script to build and publish the package to Nexus repository.
 
 import os
 import sys
+import glob
+import shlex
+import shutil
 import subprocess
 import argparse
+import importlib.metadata
 from pathlib import Path
 
 
 def run_command(command, check=True):
-    """Run a command and handle errors."""
+    """Run a command, streaming its output as it arrives, and handle errors."""
     print(f"Running: {command}")
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
+    process = subprocess.Popen(
+        command,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
     
-    if result.stdout:
-        print(result.stdout)
+    for line in process.stdout:
+        print(line, end='')
     
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
+    process.wait()
     
-    if check and result.returncode != 0:
-        sys.exit(f"Command failed with return code {result.returncode}")
+    if check and process.returncode != 0:
+        sys.exit(f"Command failed with return code {process.returncode}")
     
-    return result
+    return process
 
 
 def clean_build():
     """Clean previous build artifacts."""
     print("Cleaning previous build artifacts...")
     
-    directories_to_clean = ['build', 'dist', 'src/*.egg-info']
-    for directory in directories_to_clean:
-        run_command(f"rm -rf {directory}", check=False)
+    patterns_to_clean = ['build', 'dist', 'src/*.egg-info']
+    for pattern in patterns_to_clean:
+        for path in glob.glob(pattern):
+            shutil.rmtree(path, ignore_errors=True)
 
 
 def build_package():
     """Build the package."""
     print("Building package...")
-    run_command("python -m build")
+    # Same interpreter the 'build' module was checked against in main()
+    run_command(f"{shlex.quote(sys.executable)} -m build")
 
 
 def publish_to_nexus(nexus_url, username=None, password=None):
@@ -87,9 +99,15 @@ def main():
         sys.exit(1)
     
     try:
-        # Check if required tools are installed
-        run_command("python -m build --version")
-        run_command("twine --version")
+        # Check if required tools are installed. 'build' is looked up by its
+        # package metadata: find_spec() would accept a leftover build/
+        # directory next to this script as a namespace package
+        try:
+            importlib.metadata.version("build")
+        except importlib.metadata.PackageNotFoundError:
+            sys.exit("Error: 'build' is not installed (pip install build)")
+        if shutil.which("twine") is None:
+            sys.exit("Error: 'twine' is not installed (pip install twine)")
         
         if not args.skip_build:
             clean_build()
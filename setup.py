@@ -30,9 +30,9 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "psycopg2-binary>=2.9.0",
-        "configparser>=5.0.0",
         "hvac>=1.0.0",
         "boto3>=1.26.0",
+        "tomli>=1.1.0; python_version < '3.11'",
     ],
     extras_require={
         "dev": [
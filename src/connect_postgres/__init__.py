@@ -6,7 +6,7 @@ Supports both local development (property files) and production (Vault) environm
 """
 
 from .connection import PostgreSQLConnector
-from .config import Config
+from .config import Config, get_config
 from .exceptions import ConnectionError, ConfigurationError
 
 __version__ = "1.0.0"
@@ -15,6 +15,7 @@ __author__ = "Your Organization"
 __all__ = [
     "PostgreSQLConnector",
     "Config", 
+    "get_config",
     "ConnectionError",
     "ConfigurationError"
 ] 
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""Single-pass reader for INI-style properties files."""
+
+import re
+from typing import AbstractSet, Dict, List, Optional
+
+# One match per line: indentation, then a section header (trailing text after
+# the closing ']' is ignored), an option, or any other text (comments and
+# continuation lines); blank lines match with no group set
+_LINE_RE = re.compile(
+    r'^([ \t]*)(?:\[(.*)\].*?|([^\s#;=:][^=:\n]*?)[ \t]*[=:][ \t]*(.*?)|(\S.*?))?[ \t]*$',
+    re.MULTILINE,
+)
+
+
+def read_section(path: str, section: str, keys: AbstractSet[str]) -> Optional[Dict[str, str]]:
+    """
+    Read the given keys of one [section] from an INI-style properties file.
+
+    Follows the ConfigParser conventions the file format relies on: '#' and
+    ';' comment lines, '=' or ':' delimiters, case-insensitive keys, [DEFAULT]
+    fallbacks, '%%' as an escaped '%', and values continued on lines
+    indented deeper than their option.
+
+    Args:
+        path: Path to the properties file
+        section: Name of the section to read
+        keys: Keys to keep; any other option is ignored
+
+    Returns:
+        The section's values, or None if the section is missing
+
+    Raises:
+        ValueError: If a line is neither a section header, an option, a
+                    comment nor a continuation line
+    """
+    with open(path) as f:
+        text = f.read()
+
+    defaults: Dict[str, List[str]] = {}
+    values: Optional[Dict[str, List[str]]] = None
+    current: Optional[Dict[str, List[str]]] = None
+    # Value lines and indentation of the most recent option, for continuations
+    option_lines: Optional[List[str]] = None
+    option_indent = 0
+
+    for match in _LINE_RE.finditer(text):
+        indent, header, key, value, other = match.groups()
+        if other is not None and other[0] in '#;':
+            continue
+        if header is None and key is None and other is None:
+            if option_lines is not None:
+                option_lines.append('')
+            continue
+        if option_lines is not None and len(indent) > option_indent:
+            option_lines.append(match.group().strip())
+            continue
+
+        option_indent = len(indent)
+        if header is not None:
+            option_lines = None
+            name = header.strip()
+            if name == 'DEFAULT':
+                current = defaults
+            elif name == section:
+                if values is None:
+                    values = {}
+                current = values
+            else:
+                current = None
+        elif key is not None:
+            option_lines = [value]
+            key = key.lower()
+            if current is not None and key in keys:
+                current[key] = option_lines
+        else:
+            line = text.count('\n', 0, match.start()) + 1
+            raise ValueError(f"line {line}: expected a section, option or continuation: {other!r}")
+
+    if values is None:
+        return None
+    return {
+        key: '\n'.join(lines).rstrip().replace('%%', '%')
+        for key, lines in {**defaults, **values}.items()
+    }
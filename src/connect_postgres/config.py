@@ -1,11 +1,179 @@
 """Configuration management for PostgreSQL connections."""
 
 import os
-import configparser
-from typing import Dict, Optional
-import hvac
+import math
+import hashlib
+import time
+import functools
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from ._fast_ini import read_section
 from .exceptions import ConfigurationError, VaultError
 
+if TYPE_CHECKING:
+    import hvac
+    import requests
+
+# Vault credentials keyed by (vault_addr, vault_path, token digest) -> (credentials, expiry);
+# the token is part of the key so a Config never reuses secrets read with another token
+_CRED_CACHE: Dict[Tuple[str, str, str], Tuple[Mapping[str, Any], float]] = {}
+_CRED_CACHE_LOCK = threading.Lock()
+
+# Environment variables read by Config, with their defaults ('' if unset)
+_ENV_DEFAULTS: Dict[str, str] = {
+    'ENVIRONMENT': '',
+    'AWS_REGION': '',
+    'DB_CONFIG_FILE': 'config/database.properties',
+    'VAULT_ADDR': '',
+    'VAULT_TOKEN': '',
+    'DB_VAULT_PATH': 'secret/database/postgresql',
+    'VAULT_CACHE_TTL': '300',
+}
+
+# ENVIRONMENT values and the environment they select
+_ENV_MAP = {
+    'prod': 'prod',
+    'production': 'prod',
+    'local': 'local',
+    'dev': 'local',
+    'development': 'local',
+}
+
+# Credentials every source must provide
+_REQUIRED_KEYS = frozenset({'host', 'port', 'database', 'username', 'password'})
+
+# Keys read from the [postgresql] section of a local configuration file
+_PROPERTY_KEYS = _REQUIRED_KEYS | {'ssl_mode'}
+
+# Shared Vault client, reused while (vault_addr, vault_token) is unchanged
+_VAULT_CLIENT: Optional['hvac.Client'] = None
+_VAULT_CLIENT_KEY: Optional[Tuple[str, str]] = None
+_VAULT_SESSION: Optional['requests.Session'] = None
+_VAULT_CLIENT_LOCK = threading.Lock()
+
+
+def _get_vault_client(vault_addr: str, vault_token: str) -> 'hvac.Client':
+    """
+    Return the shared Vault client, creating it on first use.
+    
+    The client is backed by a requests.Session with a connection pool, so
+    subsequent reads reuse the open TLS connection to Vault. When the
+    address or token changes, the previous session and its pooled sockets
+    are closed.
+    """
+    global _VAULT_CLIENT, _VAULT_CLIENT_KEY, _VAULT_SESSION
+    
+    # Imported lazily: hvac pulls in requests/urllib3, which local
+    # environments never need
+    import hvac
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    with _VAULT_CLIENT_LOCK:
+        if _VAULT_CLIENT is None or _VAULT_CLIENT_KEY != (vault_addr, vault_token):
+            if _VAULT_SESSION is not None:
+                _VAULT_SESSION.close()
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _VAULT_CLIENT = hvac.Client(url=vault_addr, token=vault_token, session=session)
+            _VAULT_CLIENT_KEY = (vault_addr, vault_token)
+            _VAULT_SESSION = session
+        return _VAULT_CLIENT
+
+
+def _read_toml_section(path: str, section: str) -> Optional[Dict[str, Any]]:
+    """
+    Read one table from a TOML configuration file.
+    
+    Returns:
+        The table's values, or None if the table is missing
+    """
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ConfigurationError(
+                "Reading .toml configuration files requires Python 3.11+ or the tomli package"
+            )
+    
+    with open(path, 'rb') as f:
+        try:
+            data = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            raise ConfigurationError(f"Invalid configuration file: {e}")
+    
+    table = data.get(section)
+    if not isinstance(table, dict):
+        return None
+    return {key: value for key, value in table.items() if key in _PROPERTY_KEYS}
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_local_credentials(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """
+    Parse credentials from a local configuration file.
+    
+    Cached on (path, mtime_ns, size), so an unchanged file is parsed once
+    and any edit invalidates the entry.
+    """
+    section = 'postgresql'
+    try:
+        if path.endswith('.toml'):
+            values = _read_toml_section(path, section)
+        else:
+            values = read_section(path, section, _PROPERTY_KEYS)
+    except (OSError, ValueError) as e:
+        raise ConfigurationError(f"Invalid configuration file: {e}")
+    
+    if values is None:
+        raise ConfigurationError(f"Invalid configuration file: No section: '{section}'")
+    
+    missing = _REQUIRED_KEYS.difference(values)
+    if missing:
+        raise ConfigurationError(
+            f"Invalid configuration file: No option '{min(missing)}' in section: '{section}'"
+        )
+    
+    try:
+        port = int(values['port'])
+    except ValueError:
+        raise ConfigurationError(f"Invalid configuration file: invalid port: {values['port']!r}")
+    
+    return MappingProxyType({
+        'host': values['host'],
+        'port': port,
+        'database': values['database'],
+        'username': values['username'],
+        'password': values['password'],
+        'ssl_mode': values.get('ssl_mode', 'require')
+    })
+
+
+def _read_env() -> Dict[str, str]:
+    """Snapshot the environment variables Config uses."""
+    return {name: os.environ.get(name, default) for name, default in _ENV_DEFAULTS.items()}
+
+
+def _vault_cache_key(env: Mapping[str, str]) -> Tuple[str, str, str]:
+    """Key of the Vault credentials cache for an environment snapshot."""
+    token_digest = hashlib.sha256(env['VAULT_TOKEN'].encode()).hexdigest()
+    return env['VAULT_ADDR'], env['DB_VAULT_PATH'], token_digest
+
+
+def _detect_environment(environment: str, vault_addr: Optional[str], aws_region: Optional[str]) -> str:
+    """Auto-detect environment based on environment variables."""
+    mapped = _ENV_MAP.get(environment.lower())
+    if mapped:
+        return mapped
+    
+    # Check for common production indicators, default to local
+    return 'prod' if (vault_addr or aws_region) else 'local'
+
 
 class Config:
     """Configuration manager for PostgreSQL connections."""
@@ -14,68 +182,84 @@ class Config:
         """
         Initialize configuration manager.
         
+        Environment variables are read once here; later changes to the
+        process environment take effect after refresh().
+        
         Args:
             environment: Environment type ('local', 'prod'). 
                         If None, auto-detects from environment variables.
         """
-        self.environment = environment or self._detect_environment()
-        self._credentials: Optional[Dict[str, str]] = None
-    
-    def _detect_environment(self) -> str:
-        """Auto-detect environment based on environment variables."""
-        env = os.getenv('ENVIRONMENT', '').lower()
-        if env in ['prod', 'production']:
-            return 'prod'
-        elif env in ['local', 'dev', 'development']:
-            return 'local'
-        
-        # Check for common production indicators
-        if os.getenv('VAULT_ADDR') or os.getenv('AWS_REGION'):
-            return 'prod'
-        
-        # Default to local
-        return 'local'
-    
-    def get_credentials(self) -> Dict[str, str]:
-        """Get database credentials based on environment."""
-        if self._credentials is None:
-            if self.environment == 'local':
-                self._credentials = self._load_local_credentials()
-            elif self.environment == 'prod':
-                self._credentials = self._load_vault_credentials()
-            else:
-                raise ConfigurationError(f"Unknown environment: {self.environment}")
-        
-        return self._credentials
-    
-    def _load_local_credentials(self) -> Dict[str, str]:
-        """Load credentials from local property file."""
-        config_file = os.getenv('DB_CONFIG_FILE', 'config/database.properties')
+        # Read every variable Config uses once, up front
+        self._env = _read_env()
+        self.environment = environment or _detect_environment(
+            self._env['ENVIRONMENT'], self._env['VAULT_ADDR'], self._env['AWS_REGION']
+        )
+        self._credentials: Optional[Mapping[str, Any]] = None
+        # time.monotonic() after which _credentials must be reloaded
+        self._expires = math.inf
+        self._lock = threading.Lock()
+    
+    def get_credentials(self) -> Dict[str, Any]:
+        """
+        Get database credentials based on environment.
         
-        if not os.path.exists(config_file):
-            raise ConfigurationError(f"Configuration file not found: {config_file}")
+        Credentials are kept read-only internally: local credentials until
+        refresh(), Vault credentials until VAULT_CACHE_TTL expires. Each call
+        returns a plain dict copy the caller may modify or serialize.
+        """
+        if self._credentials is None or time.monotonic() >= self._expires:
+            with self._lock:
+                if self._credentials is None or time.monotonic() >= self._expires:
+                    if self.environment == 'local':
+                        credentials, expires = self._load_local_credentials(), math.inf
+                    elif self.environment == 'prod':
+                        credentials, expires = self._load_vault_credentials()
+                    else:
+                        raise ConfigurationError(f"Unknown environment: {self.environment}")
+                    self._credentials, self._expires = credentials, expires
         
-        config = configparser.ConfigParser()
-        config.read(config_file)
+        return dict(self._credentials)
+    
+    def refresh(self) -> None:
+        """
+        Discard cached credentials so the next get_credentials() reloads them.
+        
+        Re-reads the environment variables (e.g. a rotated VAULT_TOKEN or a
+        new DB_CONFIG_FILE) and drops the process-wide Vault cache entries
+        for the old and new configuration; local files are re-read
+        automatically when they change. The environment type itself is
+        kept.
+        """
+        with self._lock:
+            self._credentials = None
+            old_key = _vault_cache_key(self._env)
+            self._env = _read_env()
+            if self.environment == 'prod':
+                with _CRED_CACHE_LOCK:
+                    _CRED_CACHE.pop(old_key, None)
+                    _CRED_CACHE.pop(_vault_cache_key(self._env), None)
+    
+    def _load_local_credentials(self) -> Mapping[str, Any]:
+        """Load credentials from local property file."""
+        config_file = self._env['DB_CONFIG_FILE']
         
         try:
-            section = 'postgresql'
-            return {
-                'host': config.get(section, 'host'),
-                'port': config.getint(section, 'port'),
-                'database': config.get(section, 'database'),
-                'username': config.get(section, 'username'),
-                'password': config.get(section, 'password'),
-                'ssl_mode': config.get(section, 'ssl_mode', fallback='require')
-            }
-        except (configparser.NoSectionError, configparser.NoOptionError) as e:
-            raise ConfigurationError(f"Invalid configuration file: {e}")
+            st = os.stat(config_file)
+        except OSError:
+            raise ConfigurationError(f"Configuration file not found: {config_file}")
+        
+        return _parse_local_credentials(config_file, st.st_mtime_ns, st.st_size)
     
-    def _load_vault_credentials(self) -> Dict[str, str]:
-        """Load credentials from HashiCorp Vault."""
-        vault_addr = os.getenv('VAULT_ADDR')
-        vault_token = os.getenv('VAULT_TOKEN')
-        vault_path = os.getenv('DB_VAULT_PATH', 'secret/database/postgresql')
+    def _load_vault_credentials(self) -> Tuple[Mapping[str, Any], float]:
+        """
+        Load credentials from HashiCorp Vault.
+        
+        Returns:
+            (credentials, time.monotonic() at which they expire)
+        """
+        vault_addr = self._env['VAULT_ADDR']
+        vault_token = self._env['VAULT_TOKEN']
+        vault_path = self._env['DB_VAULT_PATH']
         
         if not vault_addr:
             raise ConfigurationError("VAULT_ADDR environment variable is required for production")
@@ -84,34 +268,79 @@ class Config:
             raise ConfigurationError("VAULT_TOKEN environment variable is required for production")
         
         try:
-            client = hvac.Client(url=vault_addr, token=vault_token)
-            
-            if not client.is_authenticated():
-                raise VaultError("Failed to authenticate with Vault")
+            ttl = int(self._env['VAULT_CACHE_TTL'])
+        except ValueError:
+            raise ConfigurationError(
+                f"VAULT_CACHE_TTL must be an integer number of seconds: {self._env['VAULT_CACHE_TTL']!r}"
+            )
+        
+        cache_key = _vault_cache_key(self._env)
+        cached = _CRED_CACHE.get(cache_key)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached
+        
+        import hvac
+        
+        try:
+            client = _get_vault_client(vault_addr, vault_token)
             
-            response = client.secrets.kv.v2.read_secret_version(path=vault_path)
+            # No separate is_authenticated() round-trip: a bad token makes
+            # the read itself fail
+            try:
+                response = client.secrets.kv.v2.read_secret_version(path=vault_path)
+            except (hvac.exceptions.Forbidden, hvac.exceptions.Unauthorized) as e:
+                raise VaultError("Failed to authenticate with Vault") from e
             secret_data = response['data']['data']
             
-            required_keys = ['host', 'port', 'database', 'username', 'password']
-            for key in required_keys:
-                if key not in secret_data:
-                    raise ConfigurationError(f"Missing required credential: {key}")
+            missing = _REQUIRED_KEYS.difference(secret_data)
+            if missing:
+                raise ConfigurationError(f"Missing required credential: {', '.join(sorted(missing))}")
             
-            return {
+            credentials = MappingProxyType({
                 'host': secret_data['host'],
                 'port': int(secret_data['port']),
                 'database': secret_data['database'],
                 'username': secret_data['username'],
                 'password': secret_data['password'],
                 'ssl_mode': secret_data.get('ssl_mode', 'require')
-            }
+            })
             
+        except (VaultError, ConfigurationError):
+            raise
         except hvac.exceptions.VaultError as e:
             raise VaultError(f"Vault error: {e}")
         except Exception as e:
             raise ConfigurationError(f"Failed to load credentials from Vault: {e}")
+        
+        expires = time.monotonic() + max(ttl, 0)
+        if ttl > 0:
+            with _CRED_CACHE_LOCK:
+                _CRED_CACHE[cache_key] = (credentials, expires)
+        
+        return credentials, expires
     
-    def validate_credentials(self, credentials: Dict[str, str]) -> bool:
+    def validate_credentials(self, credentials: Mapping[str, Any]) -> bool:
         """Validate that all required credentials are present."""
-        required_keys = ['host', 'port', 'database', 'username', 'password']
-        return all(key in credentials and credentials[key] for key in required_keys) 
\ No newline at end of file
+        return _REQUIRED_KEYS.issubset(credentials) and all(
+            credentials[key] not in (None, '') for key in _REQUIRED_KEYS
+        )
+    
+    def validate_many(self, credentials_list: Iterable[Mapping[str, Any]]) -> List[bool]:
+        """Validate several credential mappings, returning one result per mapping."""
+        required = _REQUIRED_KEYS
+        issubset = required.issubset
+        return [
+            issubset(credentials) and all(credentials[key] not in (None, '') for key in required)
+            for credentials in credentials_list
+        ]
+
+
+@functools.lru_cache(maxsize=4)
+def get_config(environment: Optional[str] = None) -> Config:
+    """
+    Return the process-wide Config for an environment.
+    
+    Args:
+        environment: Environment type ('local', 'prod'). Auto-detected if None.
+    """
+    return Config(environment)
\ No newline at end of file
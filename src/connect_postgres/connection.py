@@ -1,31 +1,139 @@
 """PostgreSQL connection management."""
 
+import os
+import re
+import uuid
+import hashlib
+import threading
+import warnings
+import weakref
+from collections import OrderedDict
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from typing import Optional, Dict, Any, Union
+from psycopg2 import errors
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+from psycopg2.extras import RealDictCursor, execute_batch, execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Iterator, Mapping, Tuple, Union
 from contextlib import contextmanager
 import logging
 
-from .config import Config
+from .config import Config, get_config
 from .exceptions import ConnectionError, ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Maximum prepared statements kept per connection (LRU, same as Prisma's default)
+_STATEMENT_CACHE_SIZE = 500
+
+_PREPARE_SAVEPOINT = 'connect_postgres_prepare'
+
+_PREPARABLE_RE = re.compile(r'^\s*(SELECT|INSERT|UPDATE|DELETE|VALUES|WITH)\b', re.IGNORECASE)
+_PLACEHOLDER_RE = re.compile(r'%[s%]')
+
+# INSERT ... VALUES with a single-row template of plain %s placeholders,
+# or an explicit 'VALUES %s' as accepted by execute_values
+_INSERT_VALUES_RE = re.compile(
+    r'^(\s*INSERT\s+INTO\s+.+?\bVALUES\s*)(\(\s*%s(?:\s*,\s*%s)*\s*\)|%s)(?![\w%])(.*)$',
+    re.IGNORECASE | re.DOTALL
+)
+
+# PostgreSQL duration: milliseconds by default, or with a time unit
+_TIMEOUT_RE = re.compile(r'^(\d+)\s*(us|ms|s|min|h|d)?$')
+
+# A multi-row upsert fails if one page holds the same key twice, so these
+# INSERTs are batched row by row instead
+_DO_UPDATE_RE = re.compile(r'\bON\s+CONFLICT\b.*\bDO\s+UPDATE\b', re.IGNORECASE | re.DOTALL)
+
+
+def _to_prepared_sql(query: str, interpolate: bool = True) -> Optional[Tuple[str, int]]:
+    """
+    Rewrite a psycopg2 query for PREPARE.
+    
+    Args:
+        query: SQL query string
+        interpolate: Whether psycopg2 would interpolate placeholders, i.e.
+                     whether parameters were passed
+    
+    Returns:
+        (sql with $n placeholders, parameter count), or None if the query
+        cannot be prepared (named placeholders, multiple statements, or a
+        statement type PREPARE does not accept).
+    """
+    body = query.strip().rstrip(';')
+    if not _PREPARABLE_RE.match(body) or '%(' in body or ';' in body:
+        return None
+    if not interpolate:
+        return body, 0
+    
+    count = 0
+    
+    def replace(match: 're.Match[str]') -> str:
+        nonlocal count
+        if match.group() == '%%':
+            return '%'
+        count += 1
+        return f'${count}'
+    
+    return _PLACEHOLDER_RE.sub(replace, body), count
+
+
+def _is_invalidated_statement(error: psycopg2.Error) -> bool:
+    """Whether an EXECUTE failed because the prepared statement is stale or gone."""
+    if isinstance(error, errors.InvalidSqlStatementName):
+        return True
+    return (isinstance(error, errors.FeatureNotSupported)
+            and 'cached plan must not change result type' in str(error))
+
+
+def _close_pool(pool: ThreadedConnectionPool) -> None:
+    """Close every connection in a pool; registered as a connector finalizer."""
+    if not pool.closed:
+        pool.closeall()
+
+
+def _row_to_dict(row: Any, columns: list) -> dict:
+    """Convert a tuple or namedtuple row to a dict; dict rows pass through."""
+    if isinstance(row, dict):
+        return row
+    return dict(zip(columns, row))
+
 
 class PostgreSQLConnector:
     """PostgreSQL connection manager with environment-aware credential handling."""
     
-    def __init__(self, environment: Optional[str] = None, config: Optional[Config] = None):
+    def __init__(self, environment: Optional[str] = None, config: Optional[Config] = None,
+                 cursor_factory: Optional[type] = RealDictCursor,
+                 prepare_statements: bool = False):
         """
         Initialize PostgreSQL connector.
         
         Args:
             environment: Environment type ('local', 'prod'). Auto-detected if None.
-            config: Pre-configured Config instance. Creates new one if None.
+            config: Pre-configured Config instance. Uses the shared one for
+                    the environment if None.
+            cursor_factory: Cursor class for new connections. Rows are dicts
+                            by default; NamedTupleCursor or None (plain tuples)
+                            allocate less per row on large result sets.
+            prepare_statements: Run positional-placeholder queries passed to
+                                execute_query() and execute_many() through
+                                per-connection server-side prepared
+                                statements. Ignored when PGBOUNCER=1.
         """
-        self.config = config or Config(environment)
+        self.config = config or get_config(environment)
+        self._cursor_factory = cursor_factory
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        self._finalizer: Optional[weakref.finalize] = None
         self._connection: Optional[psycopg2.extensions.connection] = None
-        self._credentials: Optional[Dict[str, Any]] = None
+        # Prepared statement names per connection, mapped to whether PREPARE
+        # succeeded; PgBouncer in transaction mode cannot keep session-level
+        # prepared statements
+        self._use_prepared = prepare_statements and os.getenv('PGBOUNCER') != '1'
+        self._statements: 'weakref.WeakKeyDictionary[Any, OrderedDict[str, bool]]' = weakref.WeakKeyDictionary()
+        self._credentials: Optional[Mapping[str, Any]] = None
+        # get_connection_info() results keyed by connection state
+        self._info_cache: Dict[bool, Mapping[str, Any]] = {}
         
         # Load and validate credentials
         try:
@@ -35,39 +143,96 @@ class PostgreSQLConnector:
         except Exception as e:
             logger.error(f"Failed to load credentials: {e}")
             raise
+        
+        self._dsn = self._build_dsn()
     
-    def connect(self) -> psycopg2.extensions.connection:
+    def _build_dsn(self) -> str:
         """
-        Establish connection to PostgreSQL database.
+        Build the libpq connection string once from the loaded credentials.
+        
+        PG_STATEMENT_TIMEOUT, if set, is sent as the 'options' startup
+        parameter, which PgBouncer rejects unless configured to ignore it,
+        so it is left out when PGBOUNCER=1.
         
-        Returns:
-            psycopg2 connection object
-            
         Raises:
-            ConnectionError: If connection fails
+            ConfigurationError: If PG_STATEMENT_TIMEOUT is not a PostgreSQL
+                                duration such as '30000' or '30s'
         """
-        if self._connection and not self._connection.closed:
-            return self._connection
+        options = {}
+        statement_timeout = os.getenv('PG_STATEMENT_TIMEOUT', '').strip()
+        if statement_timeout and os.getenv('PGBOUNCER') != '1':
+            match = _TIMEOUT_RE.match(statement_timeout)
+            if not match:
+                raise ConfigurationError(
+                    f"PG_STATEMENT_TIMEOUT must be a duration such as '30000' or '30s': {statement_timeout!r}"
+                )
+            options['options'] = f"-c statement_timeout={match.group(1)}{match.group(2) or ''}"
+        
+        return psycopg2.extensions.make_dsn(
+            host=self._credentials['host'],
+            port=self._credentials['port'],
+            dbname=self._credentials['database'],
+            user=self._credentials['username'],
+            password=self._credentials['password'],
+            sslmode=self._credentials.get('ssl_mode', 'require'),
+            connect_timeout=30,
+            application_name=os.getenv('PG_APP_NAME', 'connect-postgres'),
+            # Let the kernel detect dead peers instead of probing with queries,
+            # and give up on unacknowledged writes after tcp_user_timeout ms
+            # (e.g. after an RDS failover)
+            keepalives=1,
+            keepalives_idle=30,
+            keepalives_interval=10,
+            keepalives_count=3,
+            tcp_user_timeout=15000,
+            **options
+        )
+    
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Return the connection pool, creating it on first use."""
+        if self._pool is None or self._pool.closed:
+            with self._pool_lock:
+                if self._pool is None or self._pool.closed:
+                    self._pool = self._create_pool()
+                    # Close the pool if the connector is garbage collected
+                    # without disconnect()
+                    self._finalizer = weakref.finalize(self, _close_pool, self._pool)
+        return self._pool
+    
+    def _create_pool(self) -> ThreadedConnectionPool:
+        """
+        Create a thread-safe pool of PostgreSQL connections.
+        
+        Pool size is read from PG_POOL_MIN and PG_POOL_MAX. The pool keeps
+        at most PG_POOL_MIN idle connections: a connection returned while
+        that many are already idle is closed, so set PG_POOL_MIN to the
+        expected number of concurrent borrowers to avoid reconnecting.
+        
+        Raises:
+            ConfigurationError: If the pool size variables are invalid
+            ConnectionError: If the initial connections cannot be opened
+        """
+        try:
+            minconn = int(os.getenv('PG_POOL_MIN', '1'))
+            maxconn = int(os.getenv('PG_POOL_MAX', '10'))
+        except ValueError:
+            raise ConfigurationError("PG_POOL_MIN and PG_POOL_MAX must be integers")
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ConfigurationError(
+                f"Invalid pool size: PG_POOL_MIN={minconn}, PG_POOL_MAX={maxconn} "
+                "(need 0 <= PG_POOL_MIN <= PG_POOL_MAX and PG_POOL_MAX >= 1)"
+            )
         
         try:
-            self._connection = psycopg2.connect(
-                host=self._credentials['host'],
-                port=self._credentials['port'],
-                database=self._credentials['database'],
-                user=self._credentials['username'],
-                password=self._credentials['password'],
-                sslmode=self._credentials.get('ssl_mode', 'require'),
-                connect_timeout=30,
-                cursor_factory=RealDictCursor
+            pool = ThreadedConnectionPool(
+                minconn,
+                maxconn,
+                self._dsn,
+                cursor_factory=self._cursor_factory
             )
             
-            # Test connection
-            with self._connection.cursor() as cursor:
-                cursor.execute('SELECT 1')
-                cursor.fetchone()
-            
             logger.info(f"Successfully connected to PostgreSQL at {self._credentials['host']}:{self._credentials['port']}")
-            return self._connection
+            return pool
             
         except psycopg2.Error as e:
             logger.error(f"PostgreSQL connection error: {e}")
@@ -76,120 +241,380 @@ class PostgreSQLConnector:
             logger.error(f"Unexpected error during connection: {e}")
             raise ConnectionError(f"Unexpected connection error: {e}")
     
-    def disconnect(self) -> None:
-        """Close the database connection."""
+    def _getconn(self) -> psycopg2.extensions.connection:
+        """Borrow a connection from the pool."""
+        pool = self._get_pool()
+        try:
+            return pool.getconn()
+        except psycopg2.Error as e:
+            logger.error(f"Failed to get connection from pool: {e}")
+            raise ConnectionError(f"Failed to connect to PostgreSQL: {e}")
+    
+    def _putconn(self, connection: psycopg2.extensions.connection) -> None:
+        """Return a borrowed connection to the pool."""
+        if self._pool is not None and not self._pool.closed:
+            self._pool.putconn(connection)
+    
+    def connect(self, validate: bool = False) -> psycopg2.extensions.connection:
+        """
+        Establish connection to PostgreSQL database.
+        
+        Kept for compatibility: the returned connection is borrowed from the
+        pool and held until disconnect(). Prefer get_connection() or
+        get_cursor(), which return connections to the pool when done.
+        
+        Args:
+            validate: Run a 'SELECT 1' round-trip to verify the connection
+            
+        Returns:
+            psycopg2 connection object
+            
+        Raises:
+            ConnectionError: If connection fails
+        """
         if self._connection and not self._connection.closed:
-            self._connection.close()
-            logger.info("PostgreSQL connection closed")
+            return self._connection
+        
+        warnings.warn(
+            "connect() holds a pooled connection until disconnect(); "
+            "use get_connection() or get_cursor() instead",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        
+        connection = self._getconn()
+        if validate:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                    cursor.fetchone()
+            except psycopg2.Error as e:
+                self._putconn(connection)
+                logger.error(f"PostgreSQL connection error: {e}")
+                raise ConnectionError(f"Failed to connect to PostgreSQL: {e}")
+        
+        self._connection = connection
+        return self._connection
+    
+    def disconnect(self) -> None:
+        """Close all pooled database connections."""
+        self._connection = None
+        if self._pool is not None and not self._pool.closed:
+            if self._finalizer is not None:
+                self._finalizer.detach()
+            _close_pool(self._pool)
+            logger.info("PostgreSQL connection pool closed")
     
     def is_connected(self) -> bool:
-        """Check if connection is active."""
-        return self._connection is not None and not self._connection.closed
+        """Check if the connection pool is open."""
+        return self._pool is not None and not self._pool.closed
     
     @contextmanager
     def get_connection(self):
         """
-        Context manager for database connections.
+        Context manager for pooled database connections.
+        
+        The connection is returned to the pool on exit.
         
         Usage:
             with connector.get_connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute("SELECT * FROM table")
         """
-        connection = self.connect()
+        connection = self._getconn()
         try:
             yield connection
         finally:
-            # Don't close connection in context manager - let the user manage it
-            pass
+            self._putconn(connection)
     
     @contextmanager
-    def get_cursor(self, commit: bool = True):
+    def get_cursor(self, commit: bool = True, server_side_cursor: bool = False,
+                   readonly: bool = False):
         """
         Context manager for database cursors with automatic transaction handling.
         
         Args:
-            commit: Whether to commit the transaction automatically
+            commit: Whether to commit the transaction automatically. With
+                    commit=False, work not committed on the cursor's
+                    connection before exit is rolled back (with a
+                    RuntimeWarning) when the connection returns to the pool.
+            server_side_cursor: Use a named (server-side) cursor so rows are
+                                fetched from the server as they are iterated
+                                instead of being buffered all at once
+            readonly: Run statements in autocommit mode, skipping the
+                      BEGIN/COMMIT round-trips for read-only work. Ignored
+                      for server-side cursors, which need a transaction.
             
         Usage:
             with connector.get_cursor() as cursor:
                 cursor.execute("SELECT * FROM table")
                 result = cursor.fetchall()
         """
-        connection = self.connect()
-        cursor = connection.cursor()
+        connection = self._getconn()
+        autocommit = readonly and not server_side_cursor
+        previous_autocommit = connection.autocommit
         try:
-            yield cursor
-            if commit:
-                connection.commit()
-        except Exception:
-            connection.rollback()
-            raise
+            if autocommit:
+                connection.autocommit = True
+            if server_side_cursor:
+                cursor = connection.cursor(name=f'cur_{uuid.uuid4().hex}')
+            else:
+                cursor = connection.cursor()
+            try:
+                yield cursor
+                if not autocommit:
+                    if commit:
+                        connection.commit()
+                    elif connection.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+                        warnings.warn(
+                            "get_cursor(commit=False) exited with an uncommitted transaction; "
+                            "it is rolled back as the connection returns to the pool",
+                            RuntimeWarning,
+                            stacklevel=3
+                        )
+                        connection.rollback()
+            except Exception:
+                if not autocommit:
+                    connection.rollback()
+                raise
+            finally:
+                cursor.close()
         finally:
-            cursor.close()
+            if autocommit and not connection.closed:
+                connection.autocommit = previous_autocommit
+            self._putconn(connection)
+    
+    def _prepare(self, cursor: psycopg2.extensions.cursor, query: Any,
+                 interpolate: bool = True) -> Optional[Tuple[str, int]]:
+        """
+        Prepare a query on the cursor's connection if not already prepared.
+        
+        Only plain str queries are prepared. A query the server refuses to
+        prepare (e.g. 'IN %s' or untyped parameters) is remembered and run
+        directly from then on.
+        
+        Args:
+            cursor: Cursor to prepare the statement on
+            query: SQL query
+            interpolate: Whether parameters will be passed with the query
+        
+        Returns:
+            (statement name, parameter count), or None if the query should be
+            executed directly
+        """
+        if not self._use_prepared or not isinstance(query, str):
+            return None
+        
+        rewritten = _to_prepared_sql(query, interpolate)
+        if rewritten is None:
+            return None
+        sql, nparams = rewritten
+        
+        name = 'p_' + hashlib.blake2b(sql.encode(), digest_size=8).hexdigest()
+        statements = self._statements.setdefault(cursor.connection, OrderedDict())
+        
+        if name in statements:
+            statements.move_to_end(name)
+        else:
+            statements[name] = self._try_prepare(cursor, name, sql)
+            if len(statements) > _STATEMENT_CACHE_SIZE:
+                evicted, was_prepared = statements.popitem(last=False)
+                if was_prepared:
+                    cursor.execute(f'DEALLOCATE {evicted}')
+        
+        return (name, nparams) if statements[name] else None
+    
+    @staticmethod
+    def _try_prepare(cursor: psycopg2.extensions.cursor, name: str, sql: str) -> bool:
+        """
+        PREPARE a statement, returning whether the server accepted it.
+        
+        Inside a transaction the PREPARE runs in a savepoint, so a failure
+        leaves the transaction usable for running the query directly.
+        """
+        in_transaction = not cursor.connection.autocommit
+        if in_transaction:
+            cursor.execute(f'SAVEPOINT {_PREPARE_SAVEPOINT}')
+        try:
+            cursor.execute(f'PREPARE {name} AS {sql}')
+        except psycopg2.Error as e:
+            logger.debug(f"Running query unprepared, PREPARE failed: {e}")
+            if in_transaction:
+                cursor.execute(f'ROLLBACK TO SAVEPOINT {_PREPARE_SAVEPOINT}')
+            return False
+        if in_transaction:
+            cursor.execute(f'RELEASE SAVEPOINT {_PREPARE_SAVEPOINT}')
+        return True
+    
+    def _run(self, cursor: psycopg2.extensions.cursor, query: Any, interpolate: bool,
+             run: Callable[[Any], None]) -> None:
+        """
+        Run a query through run(sql), using a prepared statement when enabled.
+        
+        If the server reports the prepared statement as invalidated (e.g. a
+        schema change altered its result type) or missing, the transaction
+        is rolled back and the statement is prepared again once.
+        """
+        for attempt in range(2):
+            prepared = self._prepare(cursor, query, interpolate)
+            if prepared is None:
+                run(query)
+                return
+            try:
+                run(self._execute_sql(*prepared))
+                return
+            except psycopg2.Error as e:
+                if attempt or not _is_invalidated_statement(e):
+                    raise
+                self._discard_statement(cursor, prepared[0], e)
+    
+    def _discard_statement(self, cursor: psycopg2.extensions.cursor, name: str,
+                           error: psycopg2.Error) -> None:
+        """Forget an invalidated prepared statement so it is prepared again."""
+        logger.debug(f"Re-preparing invalidated statement {name}: {error}")
+        connection = cursor.connection
+        if not connection.autocommit:
+            connection.rollback()
+        statements = self._statements.get(connection)
+        if statements is not None:
+            statements.pop(name, None)
+        if not isinstance(error, errors.InvalidSqlStatementName):
+            cursor.execute(f'DEALLOCATE {name}')
     
-    def execute_query(self, query: str, params: Optional[tuple] = None, fetch: str = 'all') -> Union[list, dict, None]:
+    @staticmethod
+    def _execute_sql(name: str, nparams: int) -> str:
+        """Build the EXECUTE statement for a prepared statement."""
+        if not nparams:
+            return f'EXECUTE {name}'
+        return f"EXECUTE {name}({', '.join(['%s'] * nparams)})"
+    
+    def execute_query(self, query: str, params: Optional[tuple] = None, fetch: str = 'all',
+                      as_dict: bool = False, stream: bool = False,
+                      itersize: int = 2000, readonly: bool = False) -> Union[list, dict, Iterator, None]:
         """
         Execute a SQL query and return results.
         
+        With prepare_statements enabled, queries using positional %s
+        placeholders are run through a per-connection server-side prepared
+        statement, so repeated calls skip parsing and planning.
+        
         Args:
             query: SQL query string
             params: Query parameters
             fetch: 'all', 'one', or 'none'
+            as_dict: Return rows as dicts regardless of the cursor factory
+            stream: Return an iterator over rows read through a server-side
+                    cursor, keeping memory bounded by itersize; fetch is
+                    ignored. The pooled connection stays borrowed until the
+                    iterator is exhausted or closed.
+            itersize: Rows fetched per round-trip when streaming
+            readonly: Run in autocommit mode, saving the COMMIT round-trip
+                      for read-only queries (not applied when streaming)
             
         Returns:
-            Query results based on fetch parameter
+            Query results based on fetch parameter, or a row iterator if stream
         """
-        with self.get_cursor() as cursor:
-            cursor.execute(query, params)
+        if stream:
+            return self._stream_query(query, params, itersize, as_dict)
+        
+        with self.get_cursor(readonly=readonly) as cursor:
+            self._run(cursor, query, params is not None, lambda sql: cursor.execute(sql, params))
             
             if fetch == 'all':
-                return cursor.fetchall()
+                rows = cursor.fetchall()
+                if as_dict:
+                    columns = [column.name for column in cursor.description]
+                    return [_row_to_dict(row, columns) for row in rows]
+                return rows
             elif fetch == 'one':
-                return cursor.fetchone()
+                row = cursor.fetchone()
+                if as_dict and row is not None:
+                    return _row_to_dict(row, [column.name for column in cursor.description])
+                return row
             elif fetch == 'none':
                 return None
             else:
                 raise ValueError("fetch must be 'all', 'one', or 'none'")
     
-    def execute_many(self, query: str, params_list: list) -> None:
+    def _stream_query(self, query: str, params: Optional[tuple], itersize: int,
+                      as_dict: bool) -> Iterator:
+        """Yield rows of a query from a server-side cursor."""
+        with self.get_cursor(server_side_cursor=True) as cursor:
+            cursor.itersize = itersize
+            cursor.execute(query, params)
+            
+            if not as_dict:
+                yield from cursor
+                return
+            
+            columns = None
+            for row in cursor:
+                if columns is None:
+                    columns = [column.name for column in cursor.description]
+                yield _row_to_dict(row, columns)
+    
+    def execute_many(self, query: str, params_list: list, page_size: int = 1000) -> None:
         """
         Execute a query multiple times with different parameters.
         
+        INSERT ... VALUES (%s, ...) statements are sent as multi-row
+        INSERTs via execute_values; other statements, including upserts
+        with ON CONFLICT ... DO UPDATE, are sent in batches of page_size
+        via execute_batch, instead of one round-trip per row.
+        
         Args:
             query: SQL query string
             params_list: List of parameter tuples
+            page_size: Number of rows sent per round-trip
         """
         with self.get_cursor() as cursor:
-            cursor.executemany(query, params_list)
+            match = _INSERT_VALUES_RE.match(query)
+            if (match and '%' not in match.group(3).replace('%%', '')
+                    and not _DO_UPDATE_RE.search(match.group(3))):
+                head, template, tail = match.groups()
+                execute_values(
+                    cursor,
+                    f'{head}%s{tail}',
+                    params_list,
+                    template=None if template == '%s' else template,
+                    page_size=page_size
+                )
+                return
+            
+            self._run(cursor, query, True,
+                      lambda sql: execute_batch(cursor, sql, params_list, page_size=page_size))
     
     def get_connection_info(self) -> Dict[str, Any]:
-        """Get connection information (without sensitive data)."""
+        """
+        Get connection information (without sensitive data).
+        
+        The info is built only when the connection state changes; each call
+        returns a plain dict copy, so it can be modified or serialized
+        (e.g. with json.dumps).
+        """
         if not self._credentials:
             return {}
         
-        return {
-            'host': self._credentials['host'],
-            'port': self._credentials['port'],
-            'database': self._credentials['database'],
-            'username': self._credentials['username'],
-            'ssl_mode': self._credentials.get('ssl_mode', 'require'),
-            'environment': self.config.environment,
-            'connected': self.is_connected()
-        }
+        connected = self.is_connected()
+        info = self._info_cache.get(connected)
+        if info is None:
+            info = MappingProxyType({
+                'host': self._credentials['host'],
+                'port': self._credentials['port'],
+                'database': self._credentials['database'],
+                'username': self._credentials['username'],
+                'ssl_mode': self._credentials.get('ssl_mode', 'require'),
+                'environment': self.config.environment,
+                'connected': connected
+            })
+            self._info_cache[connected] = info
+        return dict(info)
     
     def __enter__(self):
         """Support for context manager protocol."""
-        self.connect()
+        self._get_pool()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Support for context manager protocol."""
-        self.disconnect()
-    
-    def __del__(self):
-        """Cleanup connection on object destruction."""
-        try:
-            self.disconnect()
-        except Exception:
-            pass 
\ No newline at end of file
+        self.disconnect()
\ No newline at end of file
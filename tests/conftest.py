@@ -0,0 +1,18 @@
+"""Shared fixtures for the test suite."""
+
+import hvac
+import pytest
+from unittest.mock import Mock
+
+
+@pytest.fixture
+def hvac_client(monkeypatch):
+    """
+    Replace hvac.Client with a mock class.
+
+    Tests configure the client Config receives through
+    ``hvac_client.return_value``.
+    """
+    mock_client_class = Mock()
+    monkeypatch.setattr(hvac, 'Client', mock_client_class)
+    return mock_client_class
@@ -1,218 +1,462 @@
 """Tests for the configuration module."""
 
-import os
-import tempfile
+import hvac
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
-from connect_postgres.config import Config
+from connect_postgres import config as config_module
+from connect_postgres.config import Config, get_config
+from connect_postgres.connection import PostgreSQLConnector
 from connect_postgres.exceptions import ConfigurationError, VaultError
 
+_VALID_CONFIG = """
+[postgresql]
+host = localhost
+port = 5432
+database = testdb
+username = testuser
+password = testpass
+ssl_mode = require
+"""
+
+_INVALID_CONFIG = """
+[invalid]
+host = localhost
+"""
+
+_VALID_CREDENTIALS = {
+    'host': 'localhost',
+    'port': 5432,
+    'database': 'testdb',
+    'username': 'testuser',
+    'password': 'testpass'
+}
+
+
+@pytest.fixture(scope="session")
+def config_dir(tmp_path_factory):
+    """Directory holding the shared valid and broken properties files, written once."""
+    path = tmp_path_factory.mktemp("cfg")
+    (path / "valid.properties").write_text(_VALID_CONFIG)
+    (path / "invalid.properties").write_text(_INVALID_CONFIG)
+    (path / "garbage.properties").write_text("[postgresql]\nhost localhost\n")
+    (path / "binary.properties").write_bytes(b"[postgresql]\nhost = \xff\xfe\n")
+    (path / "directory.properties").mkdir()
+    return path
+
+
+@pytest.fixture(scope="session")
+def valid_config_path(config_dir):
+    """Path to a complete [postgresql] properties file."""
+    return str(config_dir / "valid.properties")
+
+
+@pytest.fixture(scope="module")
+def cfg():
+    """Config shared by tests that do not load credentials."""
+    return Config(environment='local')
+
+
+@pytest.fixture
+def mock_vault(hvac_client):
+    """Vault client mock serving a complete secret."""
+    read_secret_version = Mock(return_value={
+        'data': {
+            'data': {
+                'host': 'vault-host.com',
+                'port': '5432',
+                'database': 'vaultdb',
+                'username': 'vaultuser',
+                'password': 'vaultpass',
+                'ssl_mode': 'require'
+            }
+        }
+    })
+    # Plain namespaces for the secrets path avoid MagicMock's per-attribute
+    # child mocks; only the leaf call is a mock
+    mock_client = SimpleNamespace(
+        secrets=SimpleNamespace(kv=SimpleNamespace(v2=SimpleNamespace(
+            read_secret_version=read_secret_version
+        )))
+    )
+    hvac_client.return_value = mock_client
+    return mock_client
+
 
 class TestConfig:
     """Test cases for Config class."""
     
-    def test_environment_detection_local(self):
-        """Test auto-detection of local environment."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = Config()
-            assert config.environment == 'local'
-    
-    def test_environment_detection_prod_from_env(self):
-        """Test detection of prod environment from ENVIRONMENT variable."""
-        with patch.dict(os.environ, {'ENVIRONMENT': 'prod'}, clear=True):
-            config = Config()
-            assert config.environment == 'prod'
-    
-    def test_environment_detection_prod_from_vault(self):
-        """Test detection of prod environment from VAULT_ADDR."""
-        with patch.dict(os.environ, {'VAULT_ADDR': 'https://vault.example.com'}, clear=True):
-            config = Config()
-            assert config.environment == 'prod'
-    
-    def test_explicit_environment(self):
-        """Test explicit environment setting."""
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        """Remove the environment variables Config inspects."""
+        for name in config_module._ENV_DEFAULTS:
+            monkeypatch.delenv(name, raising=False)
+    
+    @pytest.fixture(autouse=True)
+    def clear_credential_cache(self):
+        """Isolate tests from credentials cached by earlier tests."""
+        config_module._CRED_CACHE.clear()
+        config_module._parse_local_credentials.cache_clear()
+        config_module._VAULT_CLIENT = None
+        config_module._VAULT_SESSION = None
+        yield
+        config_module._CRED_CACHE.clear()
+        config_module._parse_local_credentials.cache_clear()
+        config_module._VAULT_CLIENT = None
+        config_module._VAULT_SESSION = None
+    
+    @pytest.mark.parametrize("env,explicit,expected", [
+        ({}, None, 'local'),
+        ({'ENVIRONMENT': 'prod'}, None, 'prod'),
+        ({'ENVIRONMENT': 'development'}, None, 'local'),
+        ({'VAULT_ADDR': 'https://vault.example.com'}, None, 'prod'),
+        ({'AWS_REGION': 'us-east-1'}, None, 'prod'),
+        ({}, 'local', 'local'),
+        ({}, 'prod', 'prod'),
+        ({'ENVIRONMENT': 'prod'}, 'local', 'local'),
+    ])
+    def test_environment_detection(self, monkeypatch, env, explicit, expected):
+        """Test auto-detection and explicit setting of the environment."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        
+        config = Config(environment=explicit) if explicit else Config()
+        assert config.environment == expected
+    
+    def test_get_config_shared_per_environment(self):
+        """Test that get_config reuses one Config per environment."""
+        get_config.cache_clear()
+        
+        assert get_config('local') is get_config('local')
+        assert get_config('local') is not get_config('prod')
+        assert get_config('prod').environment == 'prod'
+    
+    def test_local_credentials_success(self, monkeypatch, valid_config_path):
+        """Test successful loading of local credentials."""
+        monkeypatch.setenv('DB_CONFIG_FILE', valid_config_path)
+        
+        config = Config(environment='local')
+        credentials = config.get_credentials()
+        
+        assert credentials['host'] == 'localhost'
+        assert credentials['port'] == 5432
+        assert credentials['database'] == 'testdb'
+        assert credentials['username'] == 'testuser'
+        assert credentials['password'] == 'testpass'
+        assert credentials['ssl_mode'] == 'require'
+        
+        credentials['host'] = 'other'
+        assert config.get_credentials()['host'] == 'localhost'
+    
+    def test_local_credentials_memoized(self, monkeypatch, tmp_path):
+        """Test that credentials are reused until refresh() is called."""
+        config_file = tmp_path / "db.properties"
+        config_file.write_text(_VALID_CONFIG)
+        
+        monkeypatch.setenv('DB_CONFIG_FILE', str(config_file))
+        
         config = Config(environment='local')
-        assert config.environment == 'local'
+        credentials = config.get_credentials()
+        config_file.unlink()
+        
+        assert config.get_credentials() == credentials
+        
+        config.refresh()
+        with pytest.raises(ConfigurationError):
+            config.get_credentials()
+    
+    def test_refresh_rereads_environment(self, monkeypatch, tmp_path, valid_config_path):
+        """Test that refresh() picks up a changed DB_CONFIG_FILE."""
+        other_file = tmp_path / "other.properties"
+        other_file.write_text(_VALID_CONFIG.replace('testdb', 'otherdb'))
+        monkeypatch.setenv('DB_CONFIG_FILE', valid_config_path)
+        
+        config = Config(environment='local')
+        assert config.get_credentials()['database'] == 'testdb'
+        
+        monkeypatch.setenv('DB_CONFIG_FILE', str(other_file))
+        assert config.get_credentials()['database'] == 'testdb'
+        
+        config.refresh()
+        assert config.get_credentials()['database'] == 'otherdb'
+    
+    def test_vault_refresh_uses_rotated_token(self, hvac_client, mock_vault, monkeypatch):
+        """Test that refresh() reconnects to Vault with a rotated VAULT_TOKEN."""
+        monkeypatch.setenv('VAULT_ADDR', 'https://vault.example.com')
+        monkeypatch.setenv('VAULT_TOKEN', 'test-token')
         
         config = Config(environment='prod')
-        assert config.environment == 'prod'
+        config.get_credentials()
+        
+        monkeypatch.setenv('VAULT_TOKEN', 'rotated-token')
+        config.refresh()
+        config.get_credentials()
+        
+        assert hvac_client.call_args.kwargs['token'] == 'rotated-token'
     
-    def test_local_credentials_success(self):
-        """Test successful loading of local credentials."""
-        # Create temporary config file
-        config_content = """
-[postgresql]
-host = localhost
+    def test_vault_credentials_refresh(self, mock_vault, monkeypatch):
+        """Test that refresh() bypasses the Vault credential cache."""
+        mock_client = mock_vault
+        
+        monkeypatch.setenv('VAULT_ADDR', 'https://vault.example.com')
+        monkeypatch.setenv('VAULT_TOKEN', 'test-token')
+        
+        config = Config(environment='prod')
+        config.get_credentials()
+        config.refresh()
+        config.get_credentials()
+        
+        assert mock_client.secrets.kv.v2.read_secret_version.call_count == 2
+    
+    def test_local_credentials_properties_conventions(self, monkeypatch, tmp_path):
+        """Test comments, ':' delimiters, DEFAULT fallbacks, escaped '%' and continuation lines."""
+        config_file = tmp_path / "db.properties"
+        config_file.write_text("""
+# comment
+[DEFAULT]
+ssl_mode = disable
+
+[other]
+host = elsewhere
+
+[postgresql]  # main section
+; another comment
+Host: localhost
 port = 5432
 database = testdb
 username = testuser
-password = testpass
-ssl_mode = require
-"""
+password = p%%ss=word
+    q
+""")
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.properties', delete=False) as f:
-            f.write(config_content)
-            config_file = f.name
-        
-        try:
-            with patch.dict(os.environ, {'DB_CONFIG_FILE': config_file}, clear=True):
-                config = Config(environment='local')
-                credentials = config.get_credentials()
-                
-                assert credentials['host'] == 'localhost'
-                assert credentials['port'] == 5432
-                assert credentials['database'] == 'testdb'
-                assert credentials['username'] == 'testuser'
-                assert credentials['password'] == 'testpass'
-                assert credentials['ssl_mode'] == 'require'
-        finally:
-            os.unlink(config_file)
-    
-    def test_local_credentials_file_not_found(self):
-        """Test error when config file is not found."""
-        with patch.dict(os.environ, {'DB_CONFIG_FILE': 'nonexistent.properties'}, clear=True):
-            config = Config(environment='local')
-            
-            with pytest.raises(ConfigurationError) as exc_info:
-                config.get_credentials()
-            
-            assert "Configuration file not found" in str(exc_info.value)
-    
-    def test_local_credentials_invalid_config(self):
-        """Test error with invalid configuration file."""
-        config_content = """
-[invalid]
-host = localhost
-"""
+        monkeypatch.setenv('DB_CONFIG_FILE', str(config_file))
+        
+        credentials = Config(environment='local').get_credentials()
+        
+        assert credentials['host'] == 'localhost'
+        assert credentials['password'] == 'p%ss=word\nq'
+        assert credentials['ssl_mode'] == 'disable'
+    
+    def test_local_credentials_toml(self, monkeypatch, tmp_path):
+        """Test loading local credentials from a TOML file."""
+        config_file = tmp_path / "db.toml"
+        config_file.write_text("""
+[postgresql]
+host = "localhost"
+port = 5432
+database = "testdb"
+username = "testuser"
+password = "testpass"
+""")
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.properties', delete=False) as f:
-            f.write(config_content)
-            config_file = f.name
-        
-        try:
-            with patch.dict(os.environ, {'DB_CONFIG_FILE': config_file}, clear=True):
-                config = Config(environment='local')
-                
-                with pytest.raises(ConfigurationError) as exc_info:
-                    config.get_credentials()
-                
-                assert "Invalid configuration file" in str(exc_info.value)
-        finally:
-            os.unlink(config_file)
-    
-    @patch('hvac.Client')
-    def test_vault_credentials_success(self, mock_hvac_client):
+        monkeypatch.setenv('DB_CONFIG_FILE', str(config_file))
+        
+        credentials = Config(environment='local').get_credentials()
+        
+        assert credentials['host'] == 'localhost'
+        assert credentials['port'] == 5432
+        assert credentials['ssl_mode'] == 'require'
+    
+    def test_local_credentials_reloaded_when_file_changes(self, monkeypatch, tmp_path):
+        """Test that the parsed file cache is invalidated by edits."""
+        config_file = tmp_path / "db.properties"
+        config_file.write_text(_VALID_CONFIG)
+        
+        monkeypatch.setenv('DB_CONFIG_FILE', str(config_file))
+        
+        assert Config(environment='local').get_credentials()['database'] == 'testdb'
+        
+        config_file.write_text(_VALID_CONFIG.replace('testdb', 'otherdb'))
+        
+        assert Config(environment='local').get_credentials()['database'] == 'otherdb'
+    
+    @pytest.mark.parametrize("file_name,message", [
+        ("missing.properties", "Configuration file not found"),
+        ("invalid.properties", "Invalid configuration file"),
+        ("garbage.properties", "Invalid configuration file"),
+        ("binary.properties", "Invalid configuration file"),
+        ("directory.properties", "Invalid configuration file"),
+    ])
+    def test_local_credentials_error(self, monkeypatch, config_dir, file_name, message):
+        """Test errors for a missing, invalid, undecodable or unreadable configuration file."""
+        monkeypatch.setenv('DB_CONFIG_FILE', str(config_dir / file_name))
+        
+        config = Config(environment='local')
+        
+        with pytest.raises(ConfigurationError, match=message):
+            config.get_credentials()
+    
+    def test_vault_credentials_success(self, mock_vault, monkeypatch):
         """Test successful loading of Vault credentials."""
-        # Mock Vault client
-        mock_client = MagicMock()
-        mock_client.is_authenticated.return_value = True
+        monkeypatch.setenv('VAULT_ADDR', 'https://vault.example.com')
+        monkeypatch.setenv('VAULT_TOKEN', 'test-token')
+        monkeypatch.setenv('DB_VAULT_PATH', 'secret/db/postgres')
+        
+        config = Config(environment='prod')
+        credentials = config.get_credentials()
+        
+        assert credentials['host'] == 'vault-host.com'
+        assert credentials['port'] == 5432
+        assert credentials['database'] == 'vaultdb'
+        assert credentials['username'] == 'vaultuser'
+        assert credentials['password'] == 'vaultpass'
+        assert credentials['ssl_mode'] == 'require'
+    
+    def test_vault_credentials_cached(self, mock_vault, monkeypatch):
+        """Test that Vault credentials are reused until the cache TTL expires."""
+        mock_client = mock_vault
+        
+        monkeypatch.setenv('VAULT_ADDR', 'https://vault.example.com')
+        monkeypatch.setenv('VAULT_TOKEN', 'test-token')
+        
+        first = Config(environment='prod').get_credentials()
+        second = Config(environment='prod').get_credentials()
+        
+        assert first == second
+        assert mock_client.secrets.kv.v2.read_secret_version.call_count == 1
+        
+        monkeypatch.setenv('VAULT_CACHE_TTL', '0')
+        
+        config_module._CRED_CACHE.clear()
+        Config(environment='prod').get_credentials()
+        Config(environment='prod').get_credentials()
+        
+        assert mock_client.secrets.kv.v2.read_secret_version.call_count == 3
+    
+    def test_vault_cache_ttl_invalid(self, mock_vault, monkeypatch):
+        """Test that a malformed VAULT_CACHE_TTL is rejected before reading Vault."""
+        monkeypatch.setenv('VAULT_ADDR', 'https://vault.example.com')
+        monkeypatch.setenv('VAULT_TOKEN', 'test-token')
+        monkeypatch.setenv('VAULT_CACHE_TTL', '5m')
+        
+        with pytest.raises(ConfigurationError, match="VAULT_CACHE_TTL"):
+            Config(environment='prod').get_credentials()
+        
+        mock_vault.secrets.kv.v2.read_secret_version.assert_not_called()
+    
+    def test_connector_after_ttl_sees_new_credentials(self, mock_vault, monkeypatch, request):
+        """Test that the shared Config re-reads Vault once VAULT_CACHE_TTL has passed."""
+        now = [1000.0]
+        monkeypatch.setattr(config_module, 'time', SimpleNamespace(monotonic=lambda: now[0]))
+        monkeypatch.setenv('VAULT_ADDR', 'https://vault.example.com')
+        monkeypatch.setenv('VAULT_TOKEN', 'test-token')
+        monkeypatch.setenv('VAULT_CACHE_TTL', '1')
+        get_config.cache_clear()
+        request.addfinalizer(get_config.cache_clear)
+        read_secret_version = mock_vault.secrets.kv.v2.read_secret_version
+        
+        first = PostgreSQLConnector(environment='prod')
+        rotated = read_secret_version.return_value['data']['data'].copy()
+        rotated['password'] = 'rotated-pass'
+        read_secret_version.return_value = {'data': {'data': rotated}}
+        now[0] += 1.2
+        second = PostgreSQLConnector(environment='prod')
+        
+        assert first.config is second.config
+        assert first._credentials['password'] == 'vaultpass'
+        assert second._credentials['password'] == 'rotated-pass'
+        assert read_secret_version.call_count == 2
+    
+    def test_vault_credentials_cache_keyed_by_token(self, mock_vault, monkeypatch):
+        """Test that cached Vault credentials are not shared with a different token."""
+        monkeypatch.setenv('VAULT_ADDR', 'https://vault.example.com')
+        monkeypatch.setenv('VAULT_TOKEN', 'test-token')
+        Config(environment='prod').get_credentials()
+        
+        monkeypatch.setenv('VAULT_TOKEN', 'other-token')
+        Config(environment='prod').get_credentials()
+        
+        assert mock_vault.secrets.kv.v2.read_secret_version.call_count == 2
+        assert all('other-token' not in key for key in config_module._CRED_CACHE)
+    
+    def test_vault_client_reused(self, hvac_client, mock_vault, monkeypatch):
+        """Test that one Vault client is shared until the address or token changes."""
+        monkeypatch.setenv('VAULT_ADDR', 'https://vault.example.com')
+        monkeypatch.setenv('VAULT_TOKEN', 'test-token')
+        monkeypatch.setenv('VAULT_CACHE_TTL', '0')
+        
+        Config(environment='prod').get_credentials()
+        Config(environment='prod').get_credentials()
+        
+        assert hvac_client.call_count == 1
+        
+        old_session = config_module._VAULT_SESSION
+        monkeypatch.setattr(old_session, 'close', Mock())
+        monkeypatch.setenv('VAULT_TOKEN', 'new-token')
+        
+        Config(environment='prod').get_credentials()
+        
+        assert hvac_client.call_count == 2
+        old_session.close.assert_called_once()
+        assert config_module._VAULT_SESSION is not old_session
+    
+    def test_vault_credentials_missing_key(self, mock_vault, monkeypatch):
+        """Test error when the Vault secret lacks required credentials."""
+        mock_client = mock_vault
         mock_client.secrets.kv.v2.read_secret_version.return_value = {
             'data': {
                 'data': {
                     'host': 'vault-host.com',
                     'port': '5432',
-                    'database': 'vaultdb',
-                    'username': 'vaultuser',
-                    'password': 'vaultpass',
-                    'ssl_mode': 'require'
+                    'database': 'vaultdb'
                 }
             }
         }
-        mock_hvac_client.return_value = mock_client
         
-        env_vars = {
-            'VAULT_ADDR': 'https://vault.example.com',
-            'VAULT_TOKEN': 'test-token',
-            'DB_VAULT_PATH': 'secret/db/postgres'
-        }
+        monkeypatch.setenv('VAULT_ADDR', 'https://vault.example.com')
+        monkeypatch.setenv('VAULT_TOKEN', 'test-token')
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = Config(environment='prod')
-            credentials = config.get_credentials()
-            
-            assert credentials['host'] == 'vault-host.com'
-            assert credentials['port'] == 5432
-            assert credentials['database'] == 'vaultdb'
-            assert credentials['username'] == 'vaultuser'
-            assert credentials['password'] == 'vaultpass'
-            assert credentials['ssl_mode'] == 'require'
-    
-    def test_vault_credentials_missing_addr(self):
-        """Test error when VAULT_ADDR is missing."""
-        with patch.dict(os.environ, {'VAULT_TOKEN': 'test-token'}, clear=True):
-            config = Config(environment='prod')
-            
-            with pytest.raises(ConfigurationError) as exc_info:
-                config.get_credentials()
-            
-            assert "VAULT_ADDR environment variable is required" in str(exc_info.value)
-    
-    def test_vault_credentials_missing_token(self):
-        """Test error when VAULT_TOKEN is missing."""
-        with patch.dict(os.environ, {'VAULT_ADDR': 'https://vault.example.com'}, clear=True):
-            config = Config(environment='prod')
-            
-            with pytest.raises(ConfigurationError) as exc_info:
-                config.get_credentials()
-            
-            assert "VAULT_TOKEN environment variable is required" in str(exc_info.value)
-    
-    @patch('hvac.Client')
-    def test_vault_authentication_failed(self, mock_hvac_client):
-        """Test error when Vault authentication fails."""
-        mock_client = MagicMock()
-        mock_client.is_authenticated.return_value = False
-        mock_hvac_client.return_value = mock_client
+        config = Config(environment='prod')
         
-        env_vars = {
-            'VAULT_ADDR': 'https://vault.example.com',
-            'VAULT_TOKEN': 'invalid-token'
-        }
+        with pytest.raises(ConfigurationError, match=r"Missing required credential: password, username"):
+            config.get_credentials()
+    
+    @pytest.mark.parametrize("env,message", [
+        ({'VAULT_TOKEN': 'test-token'}, "VAULT_ADDR environment variable is required"),
+        ({'VAULT_ADDR': 'https://vault.example.com'}, "VAULT_TOKEN environment variable is required"),
+    ], ids=['missing_addr', 'missing_token'])
+    def test_vault_credentials_missing_env(self, monkeypatch, env, message):
+        """Test error when VAULT_ADDR or VAULT_TOKEN is missing."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = Config(environment='prod')
-            
-            with pytest.raises(VaultError) as exc_info:
-                config.get_credentials()
-            
-            assert "Failed to authenticate with Vault" in str(exc_info.value)
-    
-    def test_validate_credentials_success(self):
-        """Test successful credential validation."""
-        config = Config()
-        credentials = {
-            'host': 'localhost',
-            'port': 5432,
-            'database': 'testdb',
-            'username': 'testuser',
-            'password': 'testpass'
-        }
+        config = Config(environment='prod')
         
-        assert config.validate_credentials(credentials) is True
-    
-    def test_validate_credentials_missing_key(self):
-        """Test credential validation with missing key."""
-        config = Config()
-        credentials = {
-            'host': 'localhost',
-            'port': 5432,
-            'database': 'testdb',
-            'username': 'testuser'
-            # Missing password
-        }
+        with pytest.raises(ConfigurationError, match=message):
+            config.get_credentials()
+    
+    def test_vault_authentication_failed(self, mock_vault, monkeypatch):
+        """Test error when Vault authentication fails."""
+        mock_client = mock_vault
+        mock_client.secrets.kv.v2.read_secret_version.side_effect = hvac.exceptions.Forbidden(
+            "permission denied"
+        )
         
-        assert config.validate_credentials(credentials) is False
-    
-    def test_validate_credentials_empty_value(self):
-        """Test credential validation with empty value."""
-        config = Config()
-        credentials = {
-            'host': 'localhost',
-            'port': 5432,
-            'database': 'testdb',
-            'username': 'testuser',
-            'password': ''  # Empty password
-        }
+        monkeypatch.setenv('VAULT_ADDR', 'https://vault.example.com')
+        monkeypatch.setenv('VAULT_TOKEN', 'invalid-token')
         
-        assert config.validate_credentials(credentials) is False 
\ No newline at end of file
+        config = Config(environment='prod')
+        
+        with pytest.raises(VaultError, match=r"Failed to authenticate with Vault"):
+            config.get_credentials()
+    
+    @pytest.mark.parametrize("credentials,expected", [
+        (_VALID_CREDENTIALS, True),
+        ({k: v for k, v in _VALID_CREDENTIALS.items() if k != 'password'}, False),  # Missing password
+        (dict(_VALID_CREDENTIALS, password=''), False),  # Empty password
+        (dict(_VALID_CREDENTIALS, password=None), False),  # Null password
+    ], ids=['success', 'missing_key', 'empty_value', 'none_value'])
+    def test_validate_credentials(self, cfg, credentials, expected):
+        """Test credential validation."""
+        assert cfg.validate_credentials(credentials) is expected
+    
+    @pytest.mark.parametrize("credentials_list,expected", [
+        ([], []),
+        ([_VALID_CREDENTIALS], [True]),
+        ([_VALID_CREDENTIALS, dict(_VALID_CREDENTIALS, host=None), {'host': 'localhost'}], [True, False, False]),
+    ], ids=['empty', 'single', 'mixed'])
+    def test_validate_many(self, cfg, credentials_list, expected):
+        """Test batch validation matches validate_credentials per mapping."""
+        assert cfg.validate_many(credentials_list) == expected
+        assert expected == [cfg.validate_credentials(c) for c in credentials_list]
\ No newline at end of file
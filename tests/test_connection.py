@@ -0,0 +1,402 @@
+"""Tests for the connection module."""
+
+import gc
+import json
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+import psycopg2
+from psycopg2 import errors, sql
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+
+from connect_postgres.connection import PostgreSQLConnector, _to_prepared_sql
+from connect_postgres.exceptions import ConfigurationError, ConnectionError
+
+
+CREDENTIALS = {
+    'host': 'localhost',
+    'port': 5432,
+    'database': 'testdb',
+    'username': 'testuser',
+    'password': 'testpass',
+    'ssl_mode': 'require'
+}
+
+
+class TestPostgreSQLConnector:
+    """Test cases for PostgreSQLConnector class."""
+
+    @pytest.fixture
+    def mock_pool(self):
+        """Patch the connection pool and return the pool instance."""
+        with patch('connect_postgres.connection.ThreadedConnectionPool') as mock_pool_class:
+            pool = MagicMock()
+            pool.closed = False
+            mock_pool_class.return_value = pool
+            yield pool
+
+    @pytest.fixture
+    def connector(self):
+        """Connector backed by a mocked Config."""
+        config = MagicMock()
+        config.environment = 'local'
+        config.get_credentials.return_value = CREDENTIALS
+        config.validate_credentials.return_value = True
+        return PostgreSQLConnector(config=config)
+
+    @pytest.fixture
+    def prepared_connector(self, connector):
+        """Connector with server-side prepared statements enabled."""
+        return PostgreSQLConnector(config=connector.config, prepare_statements=True)
+
+    @pytest.fixture
+    def cursor(self, mock_pool):
+        """Cursor of the pooled connection, inside a transaction."""
+        connection = mock_pool.getconn.return_value
+        connection.autocommit = False
+        cursor = connection.cursor.return_value
+        cursor.connection = connection
+        return cursor
+
+    def test_pool_uses_prebuilt_dsn(self, connector):
+        """Test that the pool connects with the DSN built at init."""
+        with patch('connect_postgres.connection.ThreadedConnectionPool') as mock_pool_class:
+            connector.execute_query("SELECT 1")
+
+        dsn = mock_pool_class.call_args.args[2]
+        assert dsn == connector._dsn
+        assert 'host=localhost' in dsn and 'dbname=testdb' in dsn and 'password=testpass' in dsn
+        assert 'application_name=connect-postgres' in dsn
+        assert 'tcp_user_timeout=15000' in dsn
+        assert 'options' not in dsn
+
+    @pytest.mark.parametrize("value,expected", [
+        ('30000', '-c statement_timeout=30000'),
+        ('30s', '-c statement_timeout=30s'),
+        ('5 min', '-c statement_timeout=5min'),
+    ])
+    def test_statement_timeout_opt_in(self, connector, monkeypatch, value, expected):
+        """Test that PG_STATEMENT_TIMEOUT is sent as a startup option when set."""
+        monkeypatch.setenv('PG_STATEMENT_TIMEOUT', value)
+
+        connector = PostgreSQLConnector(config=connector.config)
+
+        assert psycopg2.extensions.parse_dsn(connector._dsn)['options'] == expected
+
+    def test_statement_timeout_invalid(self, connector, monkeypatch):
+        """Test that a malformed PG_STATEMENT_TIMEOUT raises ConfigurationError."""
+        monkeypatch.setenv('PG_STATEMENT_TIMEOUT', 'soon')
+
+        with pytest.raises(ConfigurationError, match="PG_STATEMENT_TIMEOUT"):
+            PostgreSQLConnector(config=connector.config)
+
+    def test_statement_timeout_omitted_for_pgbouncer(self, connector, monkeypatch):
+        """Test that PGBOUNCER=1 leaves out the options startup parameter."""
+        monkeypatch.setenv('PGBOUNCER', '1')
+        monkeypatch.setenv('PG_STATEMENT_TIMEOUT', '30s')
+
+        connector = PostgreSQLConnector(config=connector.config)
+
+        assert 'options' not in connector._dsn
+        assert 'application_name=connect-postgres' in connector._dsn
+
+    @pytest.mark.parametrize("env", [
+        {'PG_POOL_MAX': 'abc'},
+        {'PG_POOL_MIN': '5', 'PG_POOL_MAX': '2'},
+        {'PG_POOL_MIN': '0', 'PG_POOL_MAX': '0'},
+    ])
+    def test_invalid_pool_size(self, connector, mock_pool, monkeypatch, env):
+        """Test that malformed or inconsistent pool sizes raise ConfigurationError."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        with pytest.raises(ConfigurationError, match="PG_POOL_M"):
+            connector.execute_query("SELECT 1")
+
+    def test_pool_created_lazily(self, connector, mock_pool):
+        """Test that no connections are opened until first use."""
+        assert connector.is_connected() is False
+
+        connector.execute_query("SELECT 1")
+
+        assert connector.is_connected() is True
+
+    def test_connect_validate_probes_connection(self, connector, mock_pool):
+        """Test that connect(validate=True) runs SELECT 1 and keeps the connection."""
+        connection = mock_pool.getconn.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+
+        with pytest.warns(DeprecationWarning):
+            assert connector.connect(validate=True) is connection
+
+        cursor.execute.assert_called_once_with('SELECT 1')
+        mock_pool.putconn.assert_not_called()
+
+    def test_connect_validate_failure_returns_connection(self, connector, mock_pool):
+        """Test that a failed probe returns the connection to the pool and raises ConnectionError."""
+        connection = mock_pool.getconn.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = errors.AdminShutdown('terminating connection')
+
+        with pytest.warns(DeprecationWarning), pytest.raises(ConnectionError, match="Failed to connect"):
+            connector.connect(validate=True)
+
+        mock_pool.putconn.assert_called_once_with(connection)
+        assert connector._connection is None
+
+    def test_get_cursor_returns_connection_to_pool(self, connector, mock_pool):
+        """Test that get_cursor commits and returns its connection."""
+        connection = mock_pool.getconn.return_value
+
+        with connector.get_cursor() as cursor:
+            cursor.execute("UPDATE users SET name = %s", ('x',))
+
+        connection.commit.assert_called_once()
+        mock_pool.putconn.assert_called_once_with(connection)
+
+    def test_get_cursor_rollback_on_error(self, connector, mock_pool):
+        """Test that get_cursor rolls back and still returns its connection."""
+        connection = mock_pool.getconn.return_value
+
+        with pytest.raises(RuntimeError):
+            with connector.get_cursor():
+                raise RuntimeError("boom")
+
+        connection.rollback.assert_called_once()
+        connection.commit.assert_not_called()
+        mock_pool.putconn.assert_called_once_with(connection)
+
+    def test_get_cursor_readonly_skips_commit(self, connector, mock_pool):
+        """Test that readonly cursors run in autocommit and restore the setting."""
+        connection = mock_pool.getconn.return_value
+        connection.autocommit = False
+        connection.closed = False
+
+        with connector.get_cursor(readonly=True) as cursor:
+            assert connection.autocommit is True
+            cursor.execute("SELECT 1")
+
+        connection.commit.assert_not_called()
+        assert connection.autocommit is False
+
+    def test_get_cursor_without_commit_warns_on_open_transaction(self, connector, mock_pool):
+        """Test that uncommitted work under commit=False is rolled back with a warning."""
+        connection = mock_pool.getconn.return_value
+        connection.autocommit = False
+        connection.get_transaction_status.return_value = TRANSACTION_STATUS_INTRANS
+
+        with pytest.warns(RuntimeWarning, match="uncommitted transaction"):
+            with connector.get_cursor(commit=False) as cursor:
+                cursor.execute("UPDATE users SET name = %s", ('x',))
+
+        connection.commit.assert_not_called()
+        connection.rollback.assert_called_once()
+
+    def test_get_cursor_without_commit_after_manual_commit(self, connector, mock_pool, recwarn):
+        """Test that commit=False stays silent once the caller has committed."""
+        connection = mock_pool.getconn.return_value
+        connection.autocommit = False
+        connection.get_transaction_status.return_value = TRANSACTION_STATUS_IDLE
+
+        with connector.get_cursor(commit=False) as cursor:
+            cursor.connection.commit()
+
+        connection.rollback.assert_not_called()
+        assert not recwarn.list
+
+    def test_disconnect_closes_pool(self, connector, mock_pool):
+        """Test that disconnect closes every pooled connection."""
+        with connector:
+            assert connector.is_connected() is True
+
+        mock_pool.closeall.assert_called_once()
+
+    def test_pool_closed_when_connector_collected(self, connector, mock_pool):
+        """Test that an open pool is closed once the connector is garbage collected."""
+        connector = PostgreSQLConnector(config=connector.config)
+        connector.execute_query("SELECT 1")
+
+        del connector
+        gc.collect()
+
+        mock_pool.closeall.assert_called_once()
+
+    def test_get_connection_info_cached_per_state(self, connector, mock_pool):
+        """Test that connection info is reused until the connection state changes."""
+        info = connector.get_connection_info()
+
+        assert info['connected'] is False
+        assert 'password' not in info
+        assert json.loads(json.dumps(info)) == info
+        cached = connector._info_cache[False]
+        info['host'] = 'other'
+        assert connector.get_connection_info()['host'] == 'localhost'
+        assert connector._info_cache[False] is cached
+
+        with connector:
+            assert connector.get_connection_info()['connected'] is True
+
+    def test_prepared_statements_off_by_default(self, connector, cursor):
+        """Test that queries are executed directly unless preparing is enabled."""
+        connector.execute_query("SELECT * FROM users WHERE id = %s", (1,))
+
+        cursor.execute.assert_called_once_with("SELECT * FROM users WHERE id = %s", (1,))
+
+    def test_execute_query_uses_prepared_statement(self, prepared_connector, cursor):
+        """Test that repeated queries are prepared once, in a savepoint, and then executed."""
+        prepared_connector.execute_query("SELECT * FROM users WHERE id = %s", (1,))
+        prepared_connector.execute_query("SELECT * FROM users WHERE id = %s", (2,))
+
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert statements[0] == 'SAVEPOINT connect_postgres_prepare'
+        assert statements[1].startswith('PREPARE p_')
+        assert statements[1].endswith(' AS SELECT * FROM users WHERE id = $1')
+        assert statements[2] == 'RELEASE SAVEPOINT connect_postgres_prepare'
+        assert len(statements) == 5 and statements[3] == statements[4]
+        assert statements[3].startswith('EXECUTE p_') and statements[3].endswith('(%s)')
+        assert cursor.execute.call_args_list[4].args[1] == (2,)
+
+    def test_prepared_statements_disabled_for_pgbouncer(self, connector, cursor, monkeypatch):
+        """Test that PGBOUNCER=1 executes queries directly even when preparing is enabled."""
+        monkeypatch.setenv('PGBOUNCER', '1')
+        connector = PostgreSQLConnector(config=connector.config, prepare_statements=True)
+
+        connector.execute_query("SELECT * FROM users WHERE id = %s", (1,))
+
+        cursor.execute.assert_called_once_with("SELECT * FROM users WHERE id = %s", (1,))
+
+    def test_composed_query_not_prepared(self, prepared_connector, cursor):
+        """Test that psycopg2.sql objects are executed directly."""
+        query = sql.SQL("SELECT * FROM {} WHERE id = %s").format(sql.Identifier('users'))
+
+        prepared_connector.execute_query(query, (1,))
+
+        cursor.execute.assert_called_once_with(query, (1,))
+
+    def test_prepare_failure_runs_query_directly(self, prepared_connector, cursor):
+        """Test that a refused PREPARE is rolled back to its savepoint and not retried."""
+        def execute(statement, params=None):
+            if statement.startswith('PREPARE'):
+                raise errors.SyntaxError('syntax error at or near "$1"')
+        cursor.execute.side_effect = execute
+        query = "SELECT * FROM users WHERE id IN %s"
+
+        prepared_connector.execute_query(query, ((1, 2),))
+        prepared_connector.execute_query(query, ((3,),))
+
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert statements[2] == 'ROLLBACK TO SAVEPOINT connect_postgres_prepare'
+        assert statements[3:] == [query, query]
+
+    def test_invalidated_statement_prepared_again(self, prepared_connector, cursor):
+        """Test that a cached plan invalidated by a schema change is dropped and re-prepared."""
+        connection = cursor.connection
+        prepared_connector.execute_query("SELECT * FROM users WHERE id = %s", (1,))
+        failures = [errors.FeatureNotSupported('cached plan must not change result type')]
+
+        def execute(statement, params=None):
+            if statement.startswith('EXECUTE') and failures:
+                raise failures.pop()
+        cursor.execute.side_effect = execute
+        cursor.execute.reset_mock()
+
+        prepared_connector.execute_query("SELECT * FROM users WHERE id = %s", (2,))
+
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        name = statements[0][len('EXECUTE '):-len('(%s)')]
+        assert statements[0].startswith('EXECUTE p_')
+        assert statements[1] == f'DEALLOCATE {name}'
+        assert statements[3].startswith(f'PREPARE {name} AS')
+        assert statements[-1] == statements[0]
+        connection.rollback.assert_called_once()
+
+    @pytest.mark.parametrize("query,sql,template", [
+        ("INSERT INTO users (id, name) VALUES (%s, %s)", "INSERT INTO users (id, name) VALUES %s", "(%s, %s)"),
+        ("INSERT INTO users VALUES %s ON CONFLICT DO NOTHING", "INSERT INTO users VALUES %s ON CONFLICT DO NOTHING", None),
+    ])
+    def test_execute_many_uses_execute_values(self, connector, mock_pool, query, sql, template):
+        """Test that bulk INSERTs are sent as a single multi-row statement."""
+        rows = [(1, 'John'), (2, 'Jane')]
+
+        with patch('connect_postgres.connection.execute_values') as mock_execute_values:
+            connector.execute_many(query, rows)
+
+        mock_execute_values.assert_called_once()
+        assert mock_execute_values.call_args.args[1:] == (sql, rows)
+        assert mock_execute_values.call_args.kwargs['template'] == template
+
+    def test_execute_many_batches_upserts(self, connector, mock_pool):
+        """Test that ON CONFLICT DO UPDATE inserts are not collapsed into one statement."""
+        query = "INSERT INTO users (id, name) VALUES (%s, %s) ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name"
+        rows = [(1, 'John'), (1, 'Johnny')]
+
+        with patch('connect_postgres.connection.execute_values') as mock_execute_values, \
+                patch('connect_postgres.connection.execute_batch') as mock_execute_batch:
+            connector.execute_many(query, rows)
+
+        mock_execute_values.assert_not_called()
+        assert mock_execute_batch.call_args.args[1:] == (query, rows)
+
+    def test_execute_many_batches_other_statements(self, prepared_connector, cursor):
+        """Test that non-INSERT statements are batched with execute_batch."""
+        rows = [('John', 1), ('Jane', 2)]
+
+        with patch('connect_postgres.connection.execute_batch') as mock_execute_batch:
+            prepared_connector.execute_many("UPDATE users SET name = %s WHERE id = %s", rows, page_size=50)
+
+        mock_execute_batch.assert_called_once()
+        statement = mock_execute_batch.call_args.args[1]
+        assert statement.startswith('EXECUTE p_') and statement.endswith('(%s, %s)')
+        assert mock_execute_batch.call_args.kwargs['page_size'] == 50
+
+    def test_execute_query_as_dict_with_tuple_rows(self, mock_pool):
+        """Test that as_dict converts rows from non-dict cursor factories."""
+        config = MagicMock()
+        config.get_credentials.return_value = CREDENTIALS
+        connector = PostgreSQLConnector(config=config, cursor_factory=None)
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        cursor.description = [MagicMock(), MagicMock()]
+        cursor.description[0].name = 'id'
+        cursor.description[1].name = 'name'
+        cursor.fetchall.return_value = [(1, 'John'), (2, 'Jane')]
+
+        rows = connector.execute_query("SELECT id, name FROM users", as_dict=True)
+
+        assert rows == [{'id': 1, 'name': 'John'}, {'id': 2, 'name': 'Jane'}]
+
+    def test_get_cursor_server_side(self, connector, mock_pool):
+        """Test that server_side_cursor opens a named cursor."""
+        connection = mock_pool.getconn.return_value
+
+        with connector.get_cursor(server_side_cursor=True):
+            pass
+
+        assert connection.cursor.call_args.kwargs['name'].startswith('cur_')
+
+    def test_execute_query_stream(self, connector, mock_pool):
+        """Test that stream=True iterates a server-side cursor lazily."""
+        connection = mock_pool.getconn.return_value
+        cursor = connection.cursor.return_value
+        cursor.__iter__.return_value = iter([{'id': 1}, {'id': 2}])
+
+        rows = connector.execute_query("SELECT id FROM users", stream=True, itersize=100)
+        mock_pool.getconn.assert_not_called()
+
+        assert list(rows) == [{'id': 1}, {'id': 2}]
+        assert connection.cursor.call_args.kwargs['name'].startswith('cur_')
+        assert cursor.itersize == 100
+        mock_pool.putconn.assert_called_once_with(connection)
+
+
+@pytest.mark.parametrize("query,interpolate,expected", [
+    ("SELECT * FROM t WHERE a = %s AND b = %s", True, ("SELECT * FROM t WHERE a = $1 AND b = $2", 2)),
+    ("SELECT 'x%%' FROM t WHERE a = %s;", True, ("SELECT 'x%' FROM t WHERE a = $1", 1)),
+    ("SELECT 'x%%'", False, ("SELECT 'x%%'", 0)),
+    ("SELECT * FROM t WHERE a = %(a)s", True, None),
+    ("SELECT 1; SELECT 2", True, None),
+    ("CREATE TABLE t (a int)", True, None),
+])
+def test_to_prepared_sql(query, interpolate, expected):
+    """Test placeholder rewriting for PREPARE."""
+    assert _to_prepared_sql(query, interpolate) == expected